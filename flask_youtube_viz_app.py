@@ -3,7 +3,9 @@ Flask app (single-file) that:
 - Loads a YouTube trending dataset (CSV or zipped CSV).
 - Creates template files (index.html, base.html) automatically if not present.
 - Shows a webpage where user can select a category_name and visualize different plots.
-- Serves plots as PNG images generated with matplotlib/seaborn.
+- Serves plot data as JSON rendered client-side with Plotly.js, with images
+  generated by matplotlib/seaborn as a fallback (WebP when the browser accepts
+  it, otherwise PNG; SVG for the correlation heatmap).
 
 How to run:
 1. Put your dataset next to this file and name it `new_IN_youtube_trending_data.csv` (it can be a .zip containing the CSV). 
@@ -13,24 +15,80 @@ How to run:
 
 Notes:
 - The app will attempt to detect zipped CSVs and load them.
-- For large datasets, the plotting uses sampling for scatter plots to keep rendering fast.
+- If pyarrow is installed (optional), the parsed CSV is cached next to it as
+  `<dataset>.parquet` and reused on later startups until the CSV changes.
+- If numba is installed (optional), the startup histograms are built with a
+  parallel JIT kernel; otherwise NumPy is used.
+- If polars is installed (optional), the startup group-by aggregations use it;
+  otherwise pandas is used.
+- For large datasets, the interactive scatter plot uses sampling to keep rendering fast;
+  the fallback image shows a 2D density over all videos instead.
 """
 
-from flask import Flask, render_template, request, send_file, url_for
+from flask import Flask, Response, jsonify, render_template, request, url_for
 import os
 import io
 import zipfile
+import codecs
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 import matplotlib
 matplotlib.use('Agg')  # non-interactive backend for PNGs
-import matplotlib.pyplot as plt
+matplotlib.rcParams['figure.dpi'] = 72
+matplotlib.rcParams['svg.fonttype'] = 'none'  # keep SVG text as text, not glyph paths
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.ticker import FuncFormatter
 import seaborn as sns
+from PIL import Image, features as pil_features
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv  # optional: multithreaded CSV reader + Parquet cache
+except ImportError:
+    pa = pa_csv = None
+
+try:
+    from flask_compress import Compress  # optional: gzip/brotli for HTML, JSON and SVG responses
+except ImportError:
+    Compress = None
+
+try:
+    import charset_normalizer  # optional: encoding detection for non-UTF-8 CSVs
+except ImportError:
+    charset_normalizer = None
+
+try:
+    import polars as pl  # optional: faster group-by aggregations at startup
+except ImportError:
+    pl = None
+
+try:
+    from numba import get_num_threads, njit, prange  # optional: parallel histogram kernel
+except ImportError:
+    njit = None
 
 # Configuration
 DATA_FILENAME = "new_IN_youtube_trending_data.csv"  # change if needed
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+NUMERIC_COLS = ['view_count', 'likes', 'dislikes', 'comment_count', 'like_ratio']
+
+# Image formats for /plot_image: mimetype and Pillow save kwargs (None = vector, saved by matplotlib)
+IMAGE_FORMATS = {
+    'png': ('image/png', {'format': 'PNG', 'compress_level': 1}),
+    'webp': ('image/webp', {'format': 'WEBP', 'quality': 85, 'method': 4}),
+    'svg': ('image/svg+xml', None),
+}
+WEBP_SUPPORTED = pil_features.check('webp')
 
 app = Flask(__name__)
+if Compress is not None:
+    app.config['COMPRESS_MIMETYPES'] = ['text/html', 'application/json', 'image/svg+xml']
+    Compress(app)
 
 # Utility: ensure templates exist (create minimal templates if missing)
 BASE_HTML = '''<!doctype html>
@@ -104,7 +162,27 @@ INDEX_HTML = '''{% extends 'base.html' %}
 
     {% if plot_url %}
       <h3>Visualization: {{ title }}</h3>
-      <img src="{{ plot_url }}" alt="plot" style="max-width:100%;height:auto;border:1px solid #ddd;padding:8px;background:#fafafa"/>
+      <div id="plot" style="min-height:450px;border:1px solid #ddd;padding:8px;background:#fafafa"></div>
+      <noscript>
+        <img src="{{ plot_url }}" alt="plot" style="max-width:100%;height:auto;border:1px solid #ddd;padding:8px;background:#fafafa"/>
+      </noscript>
+      <script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>
+      <script>
+        (function () {
+          var el = document.getElementById('plot');
+          function fallback() {
+            el.innerHTML = '<img src="{{ plot_url }}" alt="plot" style="max-width:100%;height:auto"/>';
+          }
+          if (!window.Plotly) { fallback(); return; }
+          fetch({{ data_url|tojson }})
+            .then(function (r) { return r.json(); })
+            .then(function (fig) {
+              if (fig.error) { el.textContent = fig.error; return; }
+              Plotly.newPlot(el, fig.data, fig.layout, {responsive: true});
+            })
+            .catch(fallback);
+        })();
+      </script>
     {% else %}
       <p>Select options above and click <strong>Show</strong> to generate a plot.</p>
     {% endif %}
@@ -126,34 +204,102 @@ if not os.path.exists(index_path):
 
 # Global dataframe cache
 DF = None
+DF_VERSION = None  # dataset mtime, part of the rendered-plot cache key
 
 
 def load_data(filename):
     """Load dataset, handling zipped CSVs and common encodings."""
+    df = read_dataset(filename)
+    # Coerce numeric columns once here so request handlers can read them as-is
+    for col in NUMERIC_COLS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def optimize_dtypes(df):
+    """Store categories as pd.Categorical and downcast the numeric columns."""
+    if 'category_name' in df.columns:
+        df['category_name'] = df['category_name'].astype('category')
+    for col in ('view_count', 'likes', 'dislikes', 'comment_count'):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='unsigned')
+    if 'like_ratio' in df.columns:
+        df['like_ratio'] = df['like_ratio'].astype('float32')
+    return df
+
+
+def read_dataset(filename):
+    """Read the dataset, preferring a Parquet sidecar that is newer than the CSV."""
     if not os.path.exists(filename):
         raise FileNotFoundError(f"Data file not found: {filename}")
 
-    # Check if it's a zip file
-    with open(filename, 'rb') as f:
-        start = f.read(4)
-    if start[:2] == b'PK':  # ZIP header
+    parquet_path = filename + '.parquet'
+    if pa_csv is not None and os.path.exists(parquet_path) \
+            and os.stat(parquet_path).st_mtime_ns >= os.stat(filename).st_mtime_ns:
+        return pd.read_parquet(parquet_path)
+
+    df = read_csv_file(filename)
+    if pa_csv is not None:
+        try:
+            df.to_parquet(parquet_path, engine='pyarrow', compression='snappy')
+        except Exception as e:
+            print("Could not write Parquet cache:", e)
+    return df
+
+
+def detect_encoding(sample):
+    """Pick a text encoding from the first bytes of a CSV."""
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        sample.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        if e.start >= len(sample) - 3:
+            return 'utf-8'  # a multi-byte character was cut off at the end of the sample
+    if charset_normalizer is not None:
+        # Only choose between the Western encodings the loader has always tried;
+        # a few accented bytes are too little evidence for the full code-page list
+        best = charset_normalizer.from_bytes(sample, cp_isolation=['cp1252', 'latin_1']).best()
+        if best is not None:
+            return best.encoding
+    return 'latin1'
+
+
+def parse_csv(open_csv, encoding):
+    """Parse with the detected encoding; if a byte past the sample doesn't decode, re-parse once as latin1."""
+    try:
+        with open_csv() as f:
+            return pd.read_csv(f, encoding=encoding, engine='c', on_bad_lines='skip')
+    except UnicodeDecodeError:
+        with open_csv() as f:
+            return pd.read_csv(f, encoding='latin1', engine='c', on_bad_lines='skip')
+
+
+def read_csv_file(filename):
+    """Read the raw CSV (or zipped CSV) into a DataFrame, in at most two parses."""
+    if zipfile.is_zipfile(filename):
         z = zipfile.ZipFile(filename, 'r')
         csv_names = [n for n in z.namelist() if n.lower().endswith('.csv')]
         target = csv_names[0] if csv_names else z.namelist()[0]
         with z.open(target) as f:
-            for enc in ('utf-8', 'utf-8-sig', 'latin1', 'cp1252'):
-                try:
-                    return pd.read_csv(f, encoding=enc, engine='python')
-                except Exception:
-                    f.seek(0)
-            f.seek(0)
-            return pd.read_csv(f, encoding='latin1', engine='python', on_bad_lines='skip')
+            encoding = detect_encoding(f.read(65536))
+        if pa_csv is not None:
+            try:
+                with z.open(target) as f:
+                    table = pa_csv.read_csv(f, read_options=pa_csv.ReadOptions(encoding=encoding))
+                # pyarrow types text that doesn't decode as binary instead of raising
+                if not any(pa.types.is_binary(t) for t in table.schema.types):
+                    return table.to_pandas()
+            except Exception:
+                pass  # malformed rows; use the pandas path below
+        return parse_csv(lambda: z.open(target), encoding)
 
     # Otherwise normal CSV
-    try:
-        return pd.read_csv(filename, engine='python')
-    except Exception:
-        return pd.read_csv(filename, encoding='latin1', engine='python', on_bad_lines='skip')
+    with open(filename, 'rb') as f:
+        encoding = detect_encoding(f.read(65536))
+    return parse_csv(lambda: open(filename, 'rb'), encoding)
 
 
 # Load dataset once at startup
@@ -161,17 +307,214 @@ try:
     DF = load_data(DATA_FILENAME)
     if 'category_name' not in DF.columns and 'categoryId' in DF.columns:
         DF['category_name'] = DF['categoryId'].astype(str)
+    DF = optimize_dtypes(DF)
+    DF_VERSION = os.stat(DATA_FILENAME).st_mtime_ns
 except Exception as e:
     print("Error loading dataset:", e)
     DF = pd.DataFrame()  # fallback
 
 
+def hour_counts(hours):
+    """Uploads per hour of day, with all 24 hours present."""
+    return hours.value_counts().reindex(range(24), fill_value=0)
+
+
+def _histogram_numpy(values, lo, hi, n_bins, log_bins):
+    values = values[np.isfinite(values)]
+    if log_bins:
+        values = np.log10(values[values > 0])
+    return np.histogram(values, bins=n_bins, range=(lo, hi))[0]
+
+
+if njit is not None:
+    _NUMBA_LOCK = threading.Lock()  # the default workqueue threading layer is not thread-safe
+
+    @njit(parallel=True, cache=True)
+    def _histogram_numba(values, lo, hi, n_bins, log_bins, n_chunks):
+        # One private histogram per thread, summed at the end, so no atomics are needed
+        chunk = (len(values) + n_chunks - 1) // n_chunks
+        local = np.zeros((n_chunks, n_bins), dtype=np.int64)
+        scale = n_bins / (hi - lo)
+        for c in prange(n_chunks):
+            for i in range(c * chunk, min((c + 1) * chunk, len(values))):
+                v = values[i]
+                if log_bins:
+                    if not v > 0:
+                        continue
+                    v = np.log10(v)
+                elif not np.isfinite(v):
+                    continue
+                if v < lo or v > hi:
+                    continue  # outside [lo, hi], as np.histogram drops it
+                b = int((v - lo) * scale)
+                if v == hi:
+                    b = n_bins - 1  # right edge is inclusive, as in np.histogram
+                if 0 <= b < n_bins:
+                    local[c, b] += 1
+        return local.sum(axis=0)
+
+
+def histogram_1d(values, lo, hi, n_bins, log_bins=False):
+    """Counts in n_bins equal-width bins over [lo, hi]; with log_bins, lo/hi and the bins are in log10 space."""
+    values = np.asarray(values, dtype=np.float64)
+    if njit is not None:
+        with _NUMBA_LOCK:
+            return _histogram_numba(values, float(lo), float(hi), n_bins, log_bins, get_num_threads())
+    return _histogram_numpy(values, lo, hi, n_bins, log_bins)
+
+
+def top_categories_by_views(n=10):
+    """Top n categories by total views, as a Series indexed by plain category names."""
+    if DF_PL is not None:
+        try:
+            views = pl.col('view_count')
+            if DF_PL.schema['view_count'].is_integer():
+                views = views.cast(pl.Int64)  # downcast uint32 sums would overflow
+            top = (DF_PL.drop_nulls('category_name')
+                   .group_by('category_name').agg(views.sum())
+                   .sort('view_count', descending=True).head(n))
+            return pd.Series(top['view_count'].to_numpy(), index=top['category_name'].cast(pl.String).to_list(),
+                             name='view_count')
+        except Exception as e:  # e.g. a polars older than 1.0
+            print("polars aggregation failed, using pandas:", e)
+    top = DF.groupby('category_name', sort=False, observed=True)['view_count'].sum().nlargest(n)
+    top.index = top.index.astype(str)  # plain labels so seaborn keeps the ranking order
+    return top
+
+
+def publish_hour_counts():
+    """hour_counts() for '__all__' and for each category."""
+    counts = {'__all__': hour_counts(DF['publish_hour'])}
+    if DF_PL is not None:
+        try:
+            per_cat = DF_PL.drop_nulls('category_name').group_by('category_name', 'publish_hour').len()
+            for (cat,), sub in per_cat.partition_by('category_name', as_dict=True).items():
+                hours = pd.Series(sub['len'].to_numpy(), index=sub['publish_hour'].to_numpy())
+                counts[cat] = hours.reindex(range(24), fill_value=0)
+            return counts
+        except Exception as e:  # e.g. a polars older than 1.0
+            print("polars aggregation failed, using pandas:", e)
+            counts = {'__all__': counts['__all__']}
+    for cat, hours in DF.groupby('category_name', sort=False, observed=True)['publish_hour']:
+        counts[cat] = hour_counts(hours)
+    return counts
+
+
+# Polars copy of the group-by columns (optional; pandas is used when polars is missing)
+DF_PL = None
+if pl is not None and 'category_name' in DF.columns:
+    try:
+        DF_PL = pl.from_pandas(DF[[c for c in ('category_name', 'view_count', 'publish_hour') if c in DF.columns]])
+    except Exception as e:
+        print("Could not convert dataset to polars:", e)
+
+# Precompute static aggregates once; DF is read-only after startup
+CATEGORIES_LIST = []
+TOP_CATEGORIES = None
+PUBLISH_HOUR_COUNTS = {}
+if 'category_name' in DF.columns:
+    # astype('category') keeps an existing categorical's order, so sort explicitly for the dropdown
+    CATEGORIES_LIST = sorted(DF['category_name'].cat.categories.tolist())
+if 'category_name' in DF.columns and 'view_count' in DF.columns:
+    TOP_CATEGORIES = top_categories_by_views()
+if 'category_name' in DF.columns and 'publish_hour' in DF.columns:
+    PUBLISH_HOUR_COUNTS = publish_hour_counts()
+
+
+def like_ratio_hist(ratios):
+    """(bin edges, counts) for a 40-bin histogram over the finite like ratios."""
+    ratios = ratios.to_numpy(dtype=np.float64)
+    finite = ratios[np.isfinite(ratios)]
+    if len(finite) == 0:
+        return np.linspace(0, 1, 41), np.zeros(40, dtype=np.int64)
+    lo, hi = finite.min(), finite.max()
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5  # same fallback range as np.histogram
+    return np.linspace(lo, hi, 41), histogram_1d(ratios, lo, hi, 40)
+
+
+def log_pairs(views, likes):
+    """log10 of the (views, likes) pairs where both are positive."""
+    views = views.to_numpy(dtype=np.float64)
+    likes = likes.to_numpy(dtype=np.float64)
+    keep = (views > 0) & (likes > 0)
+    return np.log10(views[keep]), np.log10(likes[keep])
+
+
+# Whole-dataset ('__all__') histograms and correlations, plus the shared bin edges
+# (log-spaced view bins and the 200x200 log-log likes-vs-views grid) that the
+# per-category histograms below reuse
+VIEWS_LOG_RANGE = None
+VIEWS_LOG_BINS = None
+VIEWS_HIST_BY_CAT = {}
+LIKE_RATIO_HIST_BY_CAT = {}
+LIKES_VIEWS_EDGES = None
+LIKES_VIEWS_HIST2D_BY_CAT = {}
+CORR_COLS = [c for c in NUMERIC_COLS if c in DF.columns]
+CORR_ALL = DF[CORR_COLS].corr().to_numpy(dtype=np.float32)  # float32 halves the memory
+CORR_BY_CAT = {}
+if 'category_name' in DF.columns and 'view_count' in DF.columns and (DF['view_count'] > 0).any():
+    lo = np.log10(DF.loc[DF['view_count'] > 0, 'view_count'].min())
+    hi = np.log10(DF['view_count'].max())
+    VIEWS_LOG_RANGE = (lo, max(hi, lo + 1))
+    VIEWS_LOG_BINS = np.logspace(*VIEWS_LOG_RANGE, 81)
+    VIEWS_HIST_BY_CAT['__all__'] = histogram_1d(DF['view_count'], *VIEWS_LOG_RANGE, 80, log_bins=True)
+if 'category_name' in DF.columns and 'like_ratio' in DF.columns:
+    LIKE_RATIO_HIST_BY_CAT['__all__'] = like_ratio_hist(DF['like_ratio'])
+if 'category_name' in DF.columns and 'view_count' in DF.columns and 'likes' in DF.columns:
+    log_views, log_likes = log_pairs(DF['view_count'], DF['likes'])
+    if len(log_views):
+        h, xe, ye = np.histogram2d(log_views, log_likes, bins=200)
+        LIKES_VIEWS_EDGES = (xe, ye)
+        LIKES_VIEWS_HIST2D_BY_CAT['__all__'] = h.astype(np.float32)
+
+
+def precompute_category(code):
+    """Histograms and correlation matrix for the rows of one category code."""
+    sub = DF.loc[CATEGORY_CODES == code, CORR_COLS]
+    result = {'corr': sub[CORR_COLS].corr().to_numpy(dtype=np.float32)}
+    if VIEWS_LOG_RANGE is not None:
+        result['views'] = histogram_1d(sub['view_count'], *VIEWS_LOG_RANGE, 80, log_bins=True)
+    if 'like_ratio' in sub.columns:
+        result['like_ratio'] = like_ratio_hist(sub['like_ratio'])
+    if LIKES_VIEWS_EDGES is not None:
+        h = np.histogram2d(*log_pairs(sub['view_count'], sub['likes']), bins=LIKES_VIEWS_EDGES)[0]
+        result['likes_views'] = h.astype(np.float32)
+    return result
+
+
+# Categories are independent, so build their aggregates on a thread pool; the
+# NumPy/pandas kernels release the GIL and threads share DF without pickling it.
+# Workers slice their own rows by category code, so only the subframes in flight
+# are held at once rather than a copy of every category
+if 'category_name' in DF.columns:
+    CATEGORY_CODES = DF['category_name'].cat.codes.to_numpy()
+    codes = np.unique(CATEGORY_CODES[CATEGORY_CODES >= 0])  # observed categories only; -1 is missing
+    with ThreadPoolExecutor() as executor:
+        for code, result in zip(codes, executor.map(precompute_category, codes)):
+            cat = DF['category_name'].cat.categories[code]
+            CORR_BY_CAT[cat] = result['corr']
+            if 'views' in result:
+                VIEWS_HIST_BY_CAT[cat] = result['views']
+            if 'like_ratio' in result:
+                LIKE_RATIO_HIST_BY_CAT[cat] = result['like_ratio']
+            if 'likes_views' in result:
+                LIKES_VIEWS_HIST2D_BY_CAT[cat] = result['likes_views']
+
+# Hot columns as plain contiguous arrays; request handlers read these instead of DF
+DATA = {}
+CATEGORIES = np.array([], dtype=object)
+if 'category_name' in DF.columns:
+    CATEGORIES = DF['category_name'].cat.categories.to_numpy()
+    DATA['category_code'] = np.ascontiguousarray(CATEGORY_CODES)
+    for col in NUMERIC_COLS + ['publish_hour']:
+        if col in DF.columns:
+            DATA[col] = np.ascontiguousarray(DF[col].to_numpy())
+
+
 @app.route('/')
 def index():
-    cats = []
-    if DF is not None and 'category_name' in DF.columns:
-        cats = sorted(DF['category_name'].dropna().unique().tolist())
-    return render_template('index.html', categories=cats, selected=None, plot_url=None, title=None)
+    return render_template('index.html', categories=CATEGORIES_LIST, selected=None, plot_url=None, title=None)
 
 
 @app.route('/visualize')
@@ -180,7 +523,7 @@ def visualize():
     plot_type = request.args.get('plot', 'views_dist')
     sample_size = int(request.args.get('sample', 5000))
 
-    if DF is None or DF.empty:
+    if not DATA or len(DATA['category_code']) == 0:
         return "Dataframe not loaded or empty. Check server logs.", 500
 
     title_map = {
@@ -193,70 +536,243 @@ def visualize():
     }
     title = title_map.get(plot_type, 'Visualization')
 
-    plot_url = url_for('plot_image', plot=plot_type, category=category, sample=sample_size)
+    # Only the interactive scatter depends on the sample size
+    plot_url = url_for('plot_image', plot=plot_type, category=category)
+    if plot_type == 'likes_vs_views':
+        data_url = url_for('plot_data', plot=plot_type, category=category, sample=sample_size)
+    else:
+        data_url = url_for('plot_data', plot=plot_type, category=category)
+
+    return render_template('index.html', categories=CATEGORIES_LIST, selected=category,
+                           plot_url=plot_url, data_url=data_url, title=title)
+
+
+def category_rows(category):
+    """Row selector into the DATA arrays: slice(None) for '__all__', else an index array."""
+    if category == '__all__':
+        return slice(None)
+    codes = np.flatnonzero(CATEGORIES == category)
+    if not DATA or len(codes) == 0:
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(DATA['category_code'] == codes[0])
+
+
+def row_count(rows):
+    """Number of rows picked by a category_rows() selector."""
+    if not DATA:
+        return 0
+    return len(DATA['category_code'][rows])
+
+
+def sample_likes_views(rows, sample_size):
+    """Finite (views, likes) pairs: all of them, or sample_size drawn with replacement from fixed-seed indices."""
+    xs = DATA['view_count'][rows].astype(float)
+    ys = DATA['likes'][rows].astype(float)
+    keep = np.isfinite(xs) & np.isfinite(ys)
+    xs, ys = xs[keep], ys[keep]
+    if sample_size >= len(xs):
+        return xs, ys
+    idx = np.random.default_rng(0).integers(0, len(xs), sample_size)
+    return xs[idx], ys[idx]
+
+
+@app.route('/plot_data')
+def plot_data():
+    plot_type = request.args.get('plot', 'views_dist')
+    category = request.args.get('category', '__all__')
+    sample_size = max(int(request.args.get('sample', 5000)), 1)
+    if plot_type != 'likes_vs_views':
+        sample_size = None  # unused; keep one cache entry per plot/category
+
+    payload = plot_payload(plot_type, category, sample_size, DF_VERSION)
+    if 'error' in payload:
+        return jsonify(payload), 404
+    response = jsonify(payload)
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+@lru_cache(maxsize=128)
+def plot_payload(plot_type, category, sample_size, df_version):
+    """Build a Plotly figure ({'data': [...], 'layout': {...}}) for client-side rendering."""
+    rows = category_rows(category)
+    if row_count(rows) == 0:
+        return {'error': 'No data for selected category'}
+
+    if plot_type == 'views_dist':
+        if category not in VIEWS_HIST_BY_CAT:
+            return {'error': 'No positive view counts available'}
+        centers = np.sqrt(VIEWS_LOG_BINS[:-1] * VIEWS_LOG_BINS[1:])
+        data = [{'type': 'scatter', 'mode': 'lines', 'line': {'shape': 'hvh'}, 'fill': 'tozeroy',
+                 'x': centers.tolist(), 'y': VIEWS_HIST_BY_CAT[category].tolist()}]
+        layout = {'xaxis': {'type': 'log', 'title': {'text': 'Views (log scale)'}},
+                  'yaxis': {'title': {'text': 'Number of Videos'}}}
+
+    elif plot_type == 'top_categories':
+        if TOP_CATEGORIES is None:
+            return {'error': 'view_count column not available'}
+        data = [{'type': 'bar', 'orientation': 'h',
+                 'x': TOP_CATEGORIES.tolist(), 'y': TOP_CATEGORIES.index.tolist()}]
+        layout = {'xaxis': {'title': {'text': 'Total Views'}},
+                  'yaxis': {'title': {'text': 'Category'}, 'autorange': 'reversed'}}
+
+    elif plot_type == 'likes_vs_views':
+        if 'view_count' not in DATA or 'likes' not in DATA:
+            return {'error': 'view_count/likes columns not available'}
+        xs, ys = sample_likes_views(rows, sample_size)
+        data = [{'type': 'scattergl', 'mode': 'markers', 'marker': {'opacity': 0.4, 'size': 4},
+                 'x': xs.tolist(), 'y': ys.tolist()}]
+        layout = {'xaxis': {'type': 'log', 'title': {'text': 'Views (log)'}},
+                  'yaxis': {'type': 'log', 'title': {'text': 'Likes (log)'}}}
+
+    elif plot_type == 'like_ratio':
+        if category not in LIKE_RATIO_HIST_BY_CAT:
+            return {'error': 'like_ratio column not available'}
+        edges, counts = LIKE_RATIO_HIST_BY_CAT[category]
+        data = [{'type': 'bar', 'x': ((edges[:-1] + edges[1:]) / 2).tolist(), 'y': counts.tolist(),
+                 'width': np.diff(edges).tolist()}]
+        layout = {'xaxis': {'title': {'text': 'Like Ratio'}},
+                  'yaxis': {'title': {'text': 'Number of Videos'}}}
+
+    elif plot_type == 'publish_hour':
+        if category not in PUBLISH_HOUR_COUNTS:
+            return {'error': 'publish_hour column not available'}
+        data = [{'type': 'bar', 'x': list(range(24)), 'y': PUBLISH_HOUR_COUNTS[category].tolist()}]
+        layout = {'xaxis': {'title': {'text': 'Hour of Day'}, 'dtick': 1},
+                  'yaxis': {'title': {'text': 'Number of Uploads'}}}
+
+    elif plot_type == 'corr':
+        if not CORR_COLS:
+            return {'error': 'No engagement columns available'}
+        corr = CORR_ALL if category == '__all__' else CORR_BY_CAT[category]
+        z = [[None if np.isnan(v) else round(float(v), 2) for v in row] for row in corr]  # NaN is not valid JSON
+        data = [{'type': 'heatmap', 'z': z, 'x': CORR_COLS, 'y': CORR_COLS,
+                 'colorscale': 'Blues', 'texttemplate': '%{z:.2f}'}]
+        layout = {'yaxis': {'autorange': 'reversed'}}
+
+    else:
+        return {'error': 'Unknown plot type'}
 
-    cats = sorted(DF['category_name'].dropna().unique().tolist())
-    return render_template('index.html', categories=cats, selected=category, plot_url=plot_url, title=title)
+    return {'data': data, 'layout': layout}
 
 
 @app.route('/plot_image')
 def plot_image():
     plot_type = request.args.get('plot', 'views_dist')
     category = request.args.get('category', '__all__')
-    sample_size = int(request.args.get('sample', 5000))
 
-    if category == '__all__':
-        df = DF.copy()
+    # The heatmap is small and flat-coloured, so SVG beats any raster format;
+    # other plots use WebP when the browser accepts it and PNG otherwise.
+    if plot_type == 'corr':
+        fmt = 'svg'
+    elif WEBP_SUPPORTED and any(m == 'image/webp' for m, _ in request.accept_mimetypes):  # not */* or image/*
+        fmt = 'webp'
     else:
-        df = DF[DF['category_name'] == category].copy()
+        fmt = 'png'
+
+    # Plain Response over the cached bytes: no BytesIO wrapper or send_file file handling
+    image, etag = render_plot(plot_type, category, fmt, DF_VERSION)
+    response = Response(image, mimetype=IMAGE_FORMATS[fmt][0])
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    response.set_etag(etag)
+    response.vary.add('Accept')
+    return response.make_conditional(request)
+
+
+sns.set_style('whitegrid')
+
+# Matplotlib is not thread-safe (concurrent renders corrupt its shared mathtext
+# parser), so requests draw one at a time on a single reusable Figure. Unlike a
+# per-thread Figure, this is reused under any server, including the Werkzeug dev
+# server that starts a new thread per request.
+_RENDER_LOCK = threading.Lock()
+_FIGURE = Figure()
+FigureCanvasAgg(_FIGURE)
 
-    if df is None or df.empty:
-        fig, ax = plt.subplots(figsize=(6,3))
+
+def reset_figure(fig, figsize):
+    """Clear and resize a Figure, returning it with a fresh Axes."""
+    fig.clear()  # not ax.clear(): the heatmap adds a colorbar Axes
+    fig.set_size_inches(figsize)
+    return fig.add_subplot()
+
+
+def figure_bytes(fig, fmt):
+    """Encode a figure in one of IMAGE_FORMATS."""
+    buf = io.BytesIO()
+    pil_kwargs = IMAGE_FORMATS[fmt][1]
+    if pil_kwargs is None:
+        fig.savefig(buf, format=fmt)
+    else:
+        fig.canvas.draw()
+        Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB').save(buf, **pil_kwargs)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=128)
+def render_plot(plot_type, category, fmt, df_version):
+    """Render a plot to (image bytes, ETag); cached per (plot, category, format, dataset version)."""
+    # ETag from the cache key, not the bytes: SVG output embeds a date and random
+    # clip-path ids, so identical plots differ byte-wise across restarts
+    key = (plot_type, category, fmt, df_version)
+    with _RENDER_LOCK:
+        image = draw_plot(_FIGURE, plot_type, category, fmt)
+    return image, hashlib.md5(repr(key).encode('utf-8')).hexdigest()
+
+
+def draw_plot(fig, plot_type, category, fmt):
+    """Render a plot on fig to image bytes."""
+    rows = category_rows(category)
+
+    if row_count(rows) == 0:
+        ax = reset_figure(fig, (6, 3))
         ax.text(0.5, 0.5, 'No data for selected category', ha='center', va='center')
         ax.axis('off')
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', bbox_inches='tight')
-        buf.seek(0)
-        plt.close(fig)
-        return send_file(buf, mimetype='image/png')
+        return figure_bytes(fig, fmt)
 
-    for col in ['view_count','likes','dislikes','comment_count','like_ratio']:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-
-    sns.set_style('whitegrid')
-    fig, ax = plt.subplots(figsize=(10,6))
+    ax = reset_figure(fig, (10, 6))
 
     try:
         if plot_type == 'views_dist':
-            sns.histplot(df['view_count'].dropna(), bins=80, ax=ax)
+            ax.bar(VIEWS_LOG_BINS[:-1], VIEWS_HIST_BY_CAT[category], width=np.diff(VIEWS_LOG_BINS), align='edge')
             ax.set_xscale('log')
             ax.set_xlabel('Views (log scale)')
             ax.set_ylabel('Number of Videos')
 
         elif plot_type == 'top_categories':
-            grouped = DF.groupby('category_name')['view_count'].sum().sort_values(ascending=False).head(10)
+            grouped = TOP_CATEGORIES
             sns.barplot(x=grouped.values, y=grouped.index, ax=ax)
             ax.set_xlabel('Total Views')
             ax.set_ylabel('Category')
 
         elif plot_type == 'likes_vs_views':
-            s = df.sample(min(len(df), sample_size))
-            sns.scatterplot(data=s, x='view_count', y='likes', alpha=0.4, ax=ax)
-            ax.set_xscale('log')
-            ax.set_yscale('log')
+            # Density over every video rather than a point sample; cost is O(bins), not O(N)
+            xe, ye = LIKES_VIEWS_EDGES
+            density = np.log1p(np.ma.masked_equal(LIKES_VIEWS_HIST2D_BY_CAT[category], 0)).T
+            im = ax.imshow(density, origin='lower', extent=[xe[0], xe[-1], ye[0], ye[-1]],
+                           aspect='auto', cmap='magma', interpolation='nearest')
+            fig.colorbar(im, ax=ax, label='log(1 + videos)')
+            power_of_ten = FuncFormatter(lambda v, _: f'$10^{{{v:g}}}$')
+            ax.xaxis.set_major_formatter(power_of_ten)
+            ax.yaxis.set_major_formatter(power_of_ten)
+            ax.grid(False)
             ax.set_xlabel('Views (log)')
             ax.set_ylabel('Likes (log)')
 
         elif plot_type == 'like_ratio':
-            sns.histplot(df['like_ratio'].dropna(), bins=40, kde=True, ax=ax)
+            ratios = DATA['like_ratio'][rows]
+            sns.histplot(ratios[np.isfinite(ratios)], bins=40, kde=True, ax=ax)
             ax.set_xlabel('Like Ratio')
             ax.set_ylabel('Number of Videos')
 
         elif plot_type == 'publish_hour':
-            if 'publish_hour' in df.columns:
-                order = list(range(24))
-                sns.countplot(data=df, x='publish_hour', order=order, ax=ax)
+            if category in PUBLISH_HOUR_COUNTS:
+                counts = PUBLISH_HOUR_COUNTS[category]
+                ax.bar(range(24), counts.values)
+                ax.set_xticks(range(24))
                 ax.set_xlabel('Hour of Day')
                 ax.set_ylabel('Number of Uploads')
             else:
@@ -264,26 +780,21 @@ def plot_image():
                 ax.axis('off')
 
         elif plot_type == 'corr':
-            cols = [c for c in ['view_count','likes','dislikes','comment_count','like_ratio'] if c in df.columns]
-            corr = df[cols].corr()
-            sns.heatmap(corr, annot=True, fmt='.2f', cmap='Blues', ax=ax)
+            corr = CORR_ALL if category == '__all__' else CORR_BY_CAT[category]
+            sns.heatmap(corr, annot=True, fmt='.2f', cmap='Blues', ax=ax,
+                        xticklabels=CORR_COLS, yticklabels=CORR_COLS)
 
         else:
             ax.text(0.5, 0.5, 'Unknown plot type', ha='center')
             ax.axis('off')
 
     except Exception as e:
-        plt.close(fig)
-        fig, ax = plt.subplots(figsize=(6,3))
+        ax = reset_figure(fig, (6, 3))
         ax.text(0.5, 0.5, f'Error plotting: {e}', ha='center', va='center')
         ax.axis('off')
 
-    buf = io.BytesIO()
-    fig.tight_layout()
-    fig.savefig(buf, format='png', bbox_inches='tight')
-    plt.close(fig)
-    buf.seek(0)
-    return send_file(buf, mimetype='image/png')
+    fig.tight_layout()  # cheaper than bbox_inches='tight', which renders twice
+    return figure_bytes(fig, fmt)
 
 
 if __name__ == '__main__':